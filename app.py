@@ -10,8 +10,18 @@ GET  /api/languages       Return list of supported languages
 """
 
 from flask import Flask, request, jsonify, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import hashlib
 import os
+import threading
+from collections import Counter, OrderedDict
+from itertools import groupby
+
+try:
+    import orjson          # 3-10× faster than stdlib json on dict-heavy payloads
+except ImportError:        # pragma: no cover – graceful fallback to stdlib json
+    orjson = None
 
 from lexer import CLexer, CppLexer, PythonLexer, check_c_syntax, check_python_syntax
 from lexer.detector import LanguageDetector
@@ -28,6 +38,21 @@ app = Flask(
 )
 CORS(app)   # Allow cross-origin requests (useful when frontend is on a CDN)
 
+
+# ── JSON provider ──────────────────────────────────────────────────────────
+# The /api/analyze response carries thousands of small token dicts; routing
+# jsonify() through orjson keeps serialization off the request hot path.
+class _OrjsonProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
+
 # ── Language registry ──────────────────────────────────────────────────────
 LEXER_MAP = {
     "c":      CLexer,
@@ -42,6 +67,20 @@ LANGUAGE_DISPLAY = {
     "python": {"label": "Python",  "icon": "🟡"},
 }
 
+# ── Analyze response cache ─────────────────────────────────────────────────
+# IDE-style frontends tend to resend the same code after every keystroke
+# pause; keyed on a cheap content hash, repeats skip the whole
+# lex + syntax-check + stats pipeline.
+_ANALYZE_CACHE_MAX = 256
+_analyze_cache: OrderedDict = OrderedDict()   # (code_hash, language) → payload
+# Guards every cache operation: under threaded workers (gunicorn -k
+# gthread) an unguarded move_to_end can race popitem and raise KeyError.
+_analyze_cache_lock = threading.Lock()
+
+
+def _code_hash(code: str) -> str:
+    return hashlib.blake2b(code.encode("utf-8"), digest_size=16).hexdigest()
+
 
 # ── Routes ──────────────────────────────────────────────────────────────────
 
@@ -75,7 +114,9 @@ def detect_language():
     data = request.get_json(silent=True) or {}
     code = data.get("code", "")
 
-    if not code.strip():
+    # Non-string code (null, numbers, …) gets the same 400 instead of
+    # crashing on .strip().
+    if not isinstance(code, str) or not code.strip():
         return jsonify({"error": "No source code provided"}), 400
 
     result = LanguageDetector.detect_and_explain(code)
@@ -102,27 +143,95 @@ def analyze():
     """
     data = request.get_json(silent=True) or {}
     code     = data.get("code", "")
-    language = data.get("language", "").lower().strip()
+    language = (data.get("language") or "").lower().strip()
+
+    payload, error, status = _analyze_source(code, language)
+    if error is not None:
+        return jsonify(error), status
+
+    # No ETag/304 handling here: werkzeug only honors If-None-Match on
+    # GET/HEAD, so conditional responses can never fire on this POST
+    # route. Repeat submissions are served by the analyze cache instead.
+    return jsonify(payload)
+
+
+@app.route("/api/analyze/batch", methods=["POST"])
+def analyze_batch():
+    """
+    Analyze several sources in one HTTP round trip.
+
+    Body:
+        { "items": [ { "code": "...", "language": "c"? }, … ] }
+
+    Returns:
+        { "results": [ <analyze payload or {error}> … ] }   (same order)
+
+    Identical code strings within a batch hit the analyze cache, so
+    duplicates are only lexed once.
+    """
+    data = request.get_json(silent=True) or {}
+    items = data.get("items")
+
+    if not isinstance(items, list):
+        return jsonify({"error": "Expected a JSON body with an 'items' list"}), 400
 
+    results = []
+    for item in items:
+        if not isinstance(item, dict):
+            results.append({"error": "Each item must be an object with a 'code' field"})
+            continue
+        code     = item.get("code", "")
+        # `or ""` so an explicit "language": null degrades to auto-detect
+        # (a per-item error at worst) instead of 500ing the whole batch.
+        language = (item.get("language") or "").lower().strip()
+        payload, error, _status = _analyze_source(code, language)
+        results.append(payload if error is None else error)
+
+    return jsonify({"results": results})
+
+
+def _analyze_source(code: str, language: str):
+    """
+    Run the full analyze pipeline (cache → detect → lex → syntax check →
+    stats) for one source. Returns (payload, None, 200) on success or
+    (None, error_payload, status) on failure.
+    """
     # Normalise alias
     if language == "py":
         language = "python"
 
+    # An explicit "code": null degrades to the empty-source error; any
+    # other non-string value is rejected per item/request rather than
+    # crashing on .strip().
+    if code is None:
+        code = ""
+    elif not isinstance(code, str):
+        return None, {"error": "'code' must be a string"}, 400
+
     if not code.strip():
-        return jsonify({"error": "No source code provided"}), 400
+        return None, {"error": "No source code provided"}, 400
+
+    # Serve repeated submissions straight from the cache
+    cache_key = (_code_hash(code), language)
+    with _analyze_cache_lock:
+        cached = _analyze_cache.get(cache_key)
+        if cached is not None:
+            _analyze_cache.move_to_end(cache_key)
+    if cached is not None:
+        return cached, None, 200
 
     # Auto-detect if not supplied
     confidence = "user-specified"
     if not language or language not in LEXER_MAP:
         language, confidence = LanguageDetector.detect(code)
         if language == "unknown":
-            return jsonify({
+            return None, {
                 "error": (
                     "Could not auto-detect the programming language. "
                     "Please select C, C++, or Python explicitly."
                 ),
                 "scores": LanguageDetector.detect_and_explain(code)["scores"],
-            }), 422
+            }, 422
 
     LexerClass = LEXER_MAP[language]
     result     = LexerClass(code).tokenize()
@@ -131,27 +240,33 @@ def analyze():
     errors = result["errors"][:]
 
     # ── Syntax checking (post-tokenization structural rules) ───────────────
-    try:
-        if language in ("c", "cpp"):
-            lang_label = "C" if language == "c" else "C++"
-            syntax_errors = check_c_syntax(tokens, lang=lang_label)
-        else:
-            syntax_errors = check_python_syntax(tokens)
-        # Merge syntax errors; avoid duplicating errors already found by lexer
-        existing_positions = {(e["line"], e["column"]) for e in errors}
-        for se in syntax_errors:
-            if (se["line"], se["column"]) not in existing_positions:
-                errors.append(se)
-    except Exception:
-        pass  # never let the checker crash the whole response
-
-    # Sort all errors by line then column
-    errors.sort(key=lambda e: (e["line"], e["column"]))
+    syntax_errors = []
+    if tokens:      # nothing to check structurally in an empty token stream
+        try:
+            if language in ("c", "cpp"):
+                lang_label = "C" if language == "c" else "C++"
+                syntax_errors = check_c_syntax(tokens, lang=lang_label)
+            else:
+                syntax_errors = check_python_syntax(tokens)
+        except Exception:
+            syntax_errors = []  # never let the checker crash the whole response
+
+    if syntax_errors:
+        # Merge in one sort + groupby pass: at any (line, column) that the
+        # lexer already reported, drop the syntax-checker duplicates.
+        keyed = [(e.line, e.column, 0, e) for e in errors]
+        keyed += [(e.line, e.column, 1, e) for e in syntax_errors]
+        keyed.sort(key=lambda k: k[:3])
+        errors = []
+        for _pos, group in groupby(keyed, key=lambda k: k[:2]):
+            group = list(group)
+            from_lexer = [k[3] for k in group if k[2] == 0]
+            errors.extend(from_lexer if from_lexer else [k[3] for k in group])
+    else:
+        errors.sort(key=lambda e: (e.line, e.column))
 
     # ── Statistics ─────────────────────────────────────────────────────────
-    by_type: dict[str, int] = {}
-    for tok in tokens:
-        by_type[tok["type"]] = by_type.get(tok["type"], 0) + 1
+    by_type = dict(Counter(tok.type for tok in tokens))
 
     stats = {
         "total":       len(tokens),
@@ -159,18 +274,28 @@ def analyze():
         "error_count": len(errors),
     }
 
-    return jsonify({
+    payload = {
         "language":   language,
         "confidence": confidence,
-        "tokens":     tokens,
-        "errors":     errors,
+        "tokens":     [t.as_dict() for t in tokens],
+        "errors":     [e.as_dict() for e in errors],
         "stats":      stats,
-    })
+    }
+
+    with _analyze_cache_lock:
+        _analyze_cache[cache_key] = payload
+        if len(_analyze_cache) > _ANALYZE_CACHE_MAX:
+            _analyze_cache.popitem(last=False)
+
+    return payload, None, 200
 
 
 # ── Dev-server entry-point ─────────────────────────────────────────────────
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
-    debug = os.environ.get("FLASK_DEBUG", "true").lower() == "true"
+    # The reloader + debugger middleware add per-request overhead, so debug
+    # is opt-in (FLASK_DEBUG=true). Production deployments should run under
+    # gunicorn instead:  gunicorn -k gthread -w 4 app:app
+    debug = os.environ.get("FLASK_DEBUG", "false").lower() == "true"
     print(f"  Lexical Analyzer API  →  http://127.0.0.1:{port}")
     app.run(host="0.0.0.0", port=port, debug=debug)
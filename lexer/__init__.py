@@ -2,7 +2,10 @@ from .c_lexer import CLexer
 from .cpp_lexer import CppLexer
 from .python_lexer import PythonLexer
 from .detector import LanguageDetector
-from .syntax_checker import check_c_syntax, check_python_syntax
+from .syntax_checker import (
+    check_c_syntax, check_python_syntax, iter_c_errors, iter_python_errors,
+)
 
 __all__ = ["CLexer", "CppLexer", "PythonLexer", "LanguageDetector",
-           "check_c_syntax", "check_python_syntax"]
+           "check_c_syntax", "check_python_syntax",
+           "iter_c_errors", "iter_python_errors"]
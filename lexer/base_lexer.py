@@ -3,7 +3,40 @@ BaseLexer – shared cursor / source-navigation helpers.
 All language-specific lexers extend this class.
 """
 
-from .tokens import make_token, make_error, ERROR
+from array import array
+
+from .tokens import make_token, make_error, COMMENT, ERROR
+
+
+def build_op_trie(operators) -> dict:
+    """
+    Build a nested-dict trie from an operator list. Each node maps the next
+    character to a child node; a completed operator is stored under the ""
+    key, so walking as far as possible yields the longest match.
+    """
+    trie: dict = {}
+    for op in operators:
+        node = trie
+        for ch in op:
+            node = node.setdefault(ch, {})
+        node[""] = op
+    return trie
+
+
+def match_operator(trie: dict, src: str, pos: int):
+    """Longest operator match in *trie* at src[pos], or None."""
+    best = None
+    node = trie
+    n = len(src)
+    while pos < n:
+        node = node.get(src[pos])
+        if node is None:
+            break
+        op = node.get("")
+        if op is not None:
+            best = op
+        pos += 1
+    return best
 
 
 class BaseLexer:
@@ -12,8 +45,22 @@ class BaseLexer:
         self.pos: int     = 0          # current character index
         self.line: int    = 1
         self.col: int     = 1
-        self.tokens: list = []
-        self.errors: list = []
+        # ASCII fast path: indexing a bytes object yields an int directly,
+        # sparing the 1-char-str + ord() round trip in per-char dispatch.
+        # Byte offsets equal character offsets only for pure-ASCII input,
+        # so non-ASCII sources fall back to indexing the str.
+        try:
+            self._buf = source.encode("ascii")
+        except UnicodeEncodeError:
+            self._buf = None
+        # Token stream stored column-wise (struct-of-arrays): four parallel
+        # sequences instead of one object per token. The Token records are
+        # only materialized once, in _finalize().
+        self._types: list  = []
+        self._values: list = []
+        self._lines = array("i")
+        self._cols  = array("i")
+        self._messages: dict = {}      # token index → error message
 
     # ── Navigation helpers ─────────────────────────────────────────────────
     def current(self) -> str:
@@ -52,17 +99,81 @@ class BaseLexer:
         while self.current() in (" ", "\t", "\r", "\n"):
             self.advance()
 
+    def _match_run(self, regex) -> str:
+        """
+        Match *regex* at the current position and consume it in one step.
+        Only safe for patterns that cannot match a newline.
+        Returns the matched text ('' when nothing matched).
+        """
+        m = regex.match(self.source, self.pos)
+        if m is None:
+            return ""
+        value = m.group()
+        self.pos = m.end()
+        self.col += len(value)
+        return value
+
     def at_end(self) -> bool:
         return self.pos >= len(self.source)
 
+    def advance_to(self, target: int):
+        """
+        Jump the cursor straight to *target*, updating line/col bookkeeping
+        in one bulk pass instead of per-character advance() calls.
+        """
+        src = self.source
+        newlines = src.count("\n", self.pos, target)
+        if newlines:
+            self.line += newlines
+            self.col = target - src.rfind("\n", self.pos, target)
+        else:
+            self.col += target - self.pos
+        self.pos = target
+
     # ── Token / error helpers ──────────────────────────────────────────────
     def add_token(self, ttype: str, value: str, line: int, col: int):
-        self.tokens.append(make_token(ttype, value, line, col))
+        self._types.append(ttype)
+        self._values.append(value)
+        self._lines.append(line)
+        self._cols.append(col)
 
     def add_error(self, message: str, value: str, line: int, col: int):
-        err = make_error(message, value, line, col)
-        self.errors.append(err)
-        self.tokens.append(err)
+        self._types.append(ERROR)
+        self._values.append(value)
+        self._lines.append(line)
+        self._cols.append(col)
+        self._messages[len(self._types) - 1] = message
+
+    def _finalize(self) -> dict:
+        """
+        Materialize the columnar token stream into Token records. COMMENT
+        entries are dropped; each error appears in both lists as the same
+        Token object (as before the columnar rewrite).
+        """
+        tokens: list = []
+        errors: list = []
+        messages = self._messages
+        columns = zip(self._types, self._values, self._lines, self._cols)
+        if not messages:
+            # Error-free source (the common case): skip the per-token
+            # message probe entirely.
+            tokens = [
+                make_token(ttype, value, line, col)
+                for ttype, value, line, col in columns
+                if ttype != COMMENT
+            ]
+            return {"tokens": tokens, "errors": errors}
+        for i, (ttype, value, line, col) in enumerate(columns):
+            if ttype == COMMENT:
+                continue
+            message = messages.get(i)
+            if message is not None:
+                tok = make_error(message, value, line, col)
+                errors.append(tok)
+            else:
+                tok = make_token(ttype, value, line, col)
+            tokens.append(tok)
+        return {"tokens": tokens, "errors": errors}
 
     # ── Abstract entry-point ───────────────────────────────────────────────
     def tokenize(self) -> dict:
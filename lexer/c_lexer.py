@@ -13,12 +13,28 @@ C Lexer  –  fully handles:
   • Error messages specific to C
 """
 
-from .base_lexer import BaseLexer
+import re
+from sys import intern
+
+from .base_lexer import BaseLexer, build_op_trie, match_operator
 from .tokens import (
     KEYWORD, IDENTIFIER, INTEGER, FLOAT, STRING, CHAR,
     OPERATOR, DELIMITER, PREPROCESSOR, ERROR
 )
 
+# Precompiled scanners for the hot paths.  Matching a whole run in one
+# C-level call is far cheaper than advancing char-by-char in Python.
+# The identifier pattern stays Unicode-aware ([^\W\d] = letter or '_'),
+# matching the isalpha()/isalnum() semantics the per-char scan had.
+_IDENT_RE  = re.compile(r"[^\W\d]\w*")
+_DEC_RE    = re.compile(r"[0-9_]+")
+_DIGITS_RE = re.compile(r"[0-9]+")
+_HEX_RE    = re.compile(r"[0-9A-Fa-f_]+")
+_BIN_RE    = re.compile(r"[01_]+")
+_SUFFIX_RE = re.compile(r"[uUlLfF]+")
+_INT_SUFFIX_RE = re.compile(r"[uUlL]+")
+_STR_BODY_RE = re.compile(r'[^"\\\n]+')
+
 C_KEYWORDS = frozenset({
     "auto", "break", "case", "char", "const", "continue", "default",
     "do", "double", "else", "enum", "extern", "float", "for", "goto",
@@ -44,201 +60,268 @@ C_OPERATORS = [
 
 C_DELIMITERS = set("(){};,[]:#")
 
+# Operator trie: longest-match cost is O(match length), independent of
+# how many operators share a prefix.
+_C_OP_TRIE = build_op_trie(C_OPERATORS)
+
+_WS = frozenset(" \t\r\n")
+_WS_RE = re.compile(r"[ \t\r\n]+")
+
+# Single-character class sets: one hashed membership test instead of a
+# linear scan over a literal string or a Unicode-aware .isdigit() call.
+_DIGITS     = frozenset("0123456789")
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_BIN_DIGITS = frozenset("01")
+
+# Characters that force a digit run through the general number path
+# (float/exponent markers, suffixes, digit separators).
+_NUM_CONT = frozenset(".eEuUlLfF_")
+
 VALID_STRING_SUFFIXES = {"", "L", "u", "U", "u8"}
 
 
 class CLexer(BaseLexer):
     """Lexer for the C programming language."""
 
+    # Language tag baked into error messages; CppLexer overrides it so the
+    # shared readers report "[C++ Error]" without post-hoc rewriting.
+    _error_tag = "[C Error]"
+
     def tokenize(self) -> dict:
-        while not self.at_end():
-            self._scan_token()
-        return {
-            "tokens": [t for t in self.tokens if t["type"] != "COMMENT"],
-            "errors": self.errors,
-        }
+        # Bind everything the loop touches to locals once – this loop runs
+        # once per token, so every LOAD_ATTR saved here is paid back often.
+        src = self.source
+        n = len(src)
+        ws_match = _WS_RE.match
+        scan = self._scan_token          # bound once; respects subclass overrides
+        while self.pos < n:
+            # Consume whole whitespace runs in one C-level match instead
+            # of bouncing through _scan_token once per blank character.
+            m = ws_match(src, self.pos)
+            if m is not None:
+                ws_end = m.end()
+                newlines = src.count("\n", self.pos, ws_end)
+                if newlines:
+                    self.line += newlines
+                    self.col = ws_end - src.rfind("\n", self.pos, ws_end)
+                else:
+                    self.col += ws_end - self.pos
+                self.pos = ws_end
+                continue
+            scan()
+        return self._finalize()
 
     # ── Main dispatcher ────────────────────────────────────────────────────
     def _scan_token(self):
-        # Skip whitespace / newlines (C is free-form)
-        if self.current() in (" ", "\t", "\r", "\n"):
-            self.advance()
-            return
-
-        line, col = self.line, self.col
-        ch = self.current()
-
-        # ── preprocessor ──────────────────────────────────────────────────
-        if ch == "#":
-            self._read_preprocessor(line, col)
-            return
+        # Constant-time dispatch on the current character (table below).
+        # The table covers ASCII; non-ASCII letters keep the Unicode
+        # identifier semantics of the old isalpha() check.
+        buf = self._buf
+        if buf is not None:
+            handler = _C_DISPATCH[buf[self.pos]]
+        else:
+            ch = self.source[self.pos]
+            o = ord(ch)
+            if o < 128:
+                handler = _C_DISPATCH[o]
+            elif ch.isalpha():
+                handler = CLexer._read_identifier
+            else:
+                handler = CLexer._scan_symbol
+        handler(self, self.line, self.col)
+
+    # ── Dispatch handlers ─────────────────────────────────────────────────
+    def _scan_whitespace(self, line: int, col: int):
+        self.advance()
 
-        # ── line comment ──────────────────────────────────────────────────
-        if ch == "/" and self.peek() == "/":
+    def _scan_slash(self, line: int, col: int):
+        nxt = self.peek()
+        if nxt == "/":
             self._read_line_comment()
-            return
-
-        # ── block comment ─────────────────────────────────────────────────
-        if ch == "/" and self.peek() == "*":
+        elif nxt == "*":
             self._read_block_comment(line, col)
-            return
+        else:
+            self._scan_symbol(line, col)
 
-        # ── string literal ────────────────────────────────────────────────
-        if ch == '"':
-            self._read_string(line, col)
-            return
+    def _scan_dot(self, line: int, col: int):
+        if self.peek() in _DIGITS:
+            self._read_number(line, col)
+        else:
+            self._scan_symbol(line, col)
 
-        # ── wide / UTF prefixed string  L"…"  u"…"  U"…"  u8"…" ─────────
-        if ch in ("L", "u", "U") and self.peek() == '"':
-            prefix = ch
+    def _scan_str_prefix(self, line: int, col: int):
+        """L / u / U – wide / UTF string or char prefix, else identifier."""
+        ch = self.current()
+        nxt = self.peek()
+        if nxt == '"':
             self.advance()
-            self._read_string(line, col, prefix=prefix)
+            self._read_string(line, col, prefix=ch)
             return
-        if ch == "u" and self.peek() == "8" and self.peek(2) == '"':
+        if ch == "u" and nxt == "8" and self.peek(2) == '"':
             self.advance(); self.advance()
             self._read_string(line, col, prefix="u8")
             return
-
-        # ── wide char  L'…' ───────────────────────────────────────────────
-        if ch in ("L", "u", "U") and self.peek() == "'":
+        if nxt == "'":
             self.advance()
             self._read_char(line, col)
             return
+        self._read_identifier(line, col)
 
-        # ── char literal ──────────────────────────────────────────────────
-        if ch == "'":
-            self._read_char(line, col)
-            return
-
-        # ── numbers ───────────────────────────────────────────────────────
-        if ch.isdigit() or (ch == "." and self.peek().isdigit()):
-            self._read_number(line, col)
-            return
-
-        # ── identifiers / keywords ────────────────────────────────────────
-        if ch.isalpha() or ch == "_":
-            self._read_identifier(line, col)
+    def _scan_symbol(self, line: int, col: int):
+        """Operators, delimiters and the unknown-character fallback."""
+        ch = self.current()
+        op = match_operator(_C_OP_TRIE, self.source, self.pos)
+        if op is not None:
+            self.pos += len(op)
+            self.col += len(op)
+            self.add_token(OPERATOR, op, line, col)
             return
 
-        # ── operators ─────────────────────────────────────────────────────
-        for op in C_OPERATORS:
-            if self.source[self.pos: self.pos + len(op)] == op:
-                for _ in op:
-                    self.advance()
-                self.add_token(OPERATOR, op, line, col)
-                return
-
-        # ── delimiters ────────────────────────────────────────────────────
         if ch in C_DELIMITERS:
             self.advance()
             self.add_token(DELIMITER, ch, line, col)
             return
 
-        # ── unknown character ─────────────────────────────────────────────
         self.advance()
         self.add_error(
-            f"[C Error] Unknown character '{ch}' (ASCII {ord(ch)})",
+            f"{self._error_tag} Unknown character '{ch}' (ASCII {ord(ch)})",
             ch, line, col,
         )
 
     # ── Preprocessor ──────────────────────────────────────────────────────
     def _read_preprocessor(self, line: int, col: int):
-        text = ""
-        while not self.at_end() and self.current() != "\n":
-            # Support line-continuation
-            if self.current() == "\\" and self.peek() == "\n":
-                self.advance(); self.advance()
-                continue
-            text += self.advance()
+        src = self.source
+        start = self.pos
+        # Find the directive end, jumping over '\'-continued lines.
+        nl = src.find("\n", start)
+        while nl != -1 and src[nl - 1] == "\\":
+            nl = src.find("\n", nl + 1)
+        end = len(src) if nl == -1 else nl
+        raw = src[start:end]
+        self.pos = end
+        newlines = raw.count("\n")
+        if newlines:
+            self.line += newlines
+            self.col = end - src.rfind("\n", start, end)
+            text = raw.replace("\\\n", "")
+        else:
+            # No newline consumed ⇒ no continuation to splice out.
+            self.col += end - start
+            text = raw
         self.add_token(PREPROCESSOR, text.strip(), line, col)
 
     # ── Comments ──────────────────────────────────────────────────────────
     def _read_line_comment(self):
-        while not self.at_end() and self.current() != "\n":
-            self.advance()
+        nl = self.source.find("\n", self.pos)
+        end = len(self.source) if nl == -1 else nl
+        self.col += end - self.pos
+        self.pos = end
 
     def _read_block_comment(self, line: int, col: int):
-        self.advance(); self.advance()          # consume /*
-        while not self.at_end():
-            if self.current() == "*" and self.peek() == "/":
-                self.advance(); self.advance()  # consume */
-                return
-            self.advance()
-        self.add_error(
-            "[C Error] Unterminated block comment – missing closing '*/'",
-            "/*", line, col,
-        )
+        # One C-level substring search to the terminator instead of a
+        # per-character scan through what may be a very long comment.
+        src = self.source
+        end = src.find("*/", self.pos + 2)
+        if end == -1:
+            self.advance_to(len(src))
+            self.add_error(
+                f"{self._error_tag} Unterminated block comment – missing closing '*/'",
+                "/*", line, col,
+            )
+            return
+        self.advance_to(end + 2)
 
     # ── String literal ────────────────────────────────────────────────────
     def _read_string(self, line: int, col: int, prefix: str = ""):
+        src = self.source
+        start = self.pos - len(prefix)          # include already-consumed prefix
         self.advance()                          # consume opening "
-        value = prefix + '"'
         while not self.at_end():
+            # Skip the whole run of ordinary body characters in one match;
+            # the loop only handles whatever stopped it.
+            self._match_run(_STR_BODY_RE)
             ch = self.current()
+            if ch == "":
+                break
             if ch == "\n":
                 self.add_error(
-                    "[C Error] Unterminated string literal – newline inside string",
-                    value, line, col,
+                    f"{self._error_tag} Unterminated string literal – newline inside string",
+                    src[start:self.pos], line, col,
                 )
                 return
             if ch == "\\":
                 self.advance()
-                value += self._read_escape(self.line, self.col)
+                self._read_escape(self.line, self.col)
                 continue
-            if ch == '"':
-                value += self.advance()
-                # optional suffix  e.g. nothing in standard C for strings
-                self.add_token(STRING, value, line, col)
-                return
-            value += self.advance()
+            # ch == '"'
+            self.advance()
+            self.add_token(STRING, src[start:self.pos], line, col)
+            return
         self.add_error(
-            "[C Error] Unterminated string literal – reached end of file",
-            value, line, col,
+            f"{self._error_tag} Unterminated string literal – reached end of file",
+            src[start:self.pos], line, col,
         )
 
     # ── Char literal ──────────────────────────────────────────────────────
     def _read_char(self, line: int, col: int):
-        self.advance()                          # consume opening '
-        value = "'"
+        src = self.source
+        n = len(src)
+        advance = self.advance
+        start = self.pos
+        advance()                               # consume opening '
         char_count = 0
-        while not self.at_end():
-            ch = self.current()
+        while self.pos < n:
+            ch = src[self.pos]
             if ch == "\n":
                 self.add_error(
-                    "[C Error] Unterminated character literal – newline inside char",
-                    value, line, col,
+                    f"{self._error_tag} Unterminated character literal – newline inside char",
+                    src[start:self.pos], line, col,
                 )
                 return
             if ch == "\\":
-                self.advance()
-                value += self._read_escape(self.line, self.col)
+                advance()
+                self._read_escape(self.line, self.col)
                 char_count += 1
                 continue
             if ch == "'":
-                value += self.advance()
+                advance()
+                value = src[start:self.pos]
                 if char_count == 0:
                     self.add_error(
-                        "[C Error] Empty character literal ''",
+                        f"{self._error_tag} Empty character literal ''",
                         value, line, col,
                     )
                 elif char_count > 1:
                     self.add_error(
-                        f"[C Error] Multi-character character literal '{value}' "
+                        f"{self._error_tag} Multi-character character literal '{value}' "
                         "(implementation-defined behavior)",
                         value, line, col,
                     )
                 else:
                     self.add_token(CHAR, value, line, col)
                 return
-            value += self.advance()
+            advance()
             char_count += 1
         self.add_error(
-            "[C Error] Unterminated character literal – reached end of file",
-            value, line, col,
+            f"{self._error_tag} Unterminated character literal – reached end of file",
+            src[start:self.pos], line, col,
         )
 
     # ── Number ────────────────────────────────────────────────────────────
     def _read_number(self, line: int, col: int):
+        # Fast path: a plain decimal integer (no leading zero, no float
+        # marker, no suffix) – by far the most common numeric literal.
+        src = self.source
+        if src[self.pos] in _DIGITS and src[self.pos] != "0":
+            m = _DIGITS_RE.match(src, self.pos)
+            end = m.end()
+            if end >= len(src) or src[end] not in _NUM_CONT:
+                value = m.group()
+                self.pos = end
+                self.col += len(value)
+                self.add_token(INTEGER, value, line, col)
+                return
+
         value = ""
         is_float = False
         decimal_count = 0
@@ -246,14 +329,13 @@ class CLexer(BaseLexer):
         # Hexadecimal
         if self.current() == "0" and self.peek() in ("x", "X"):
             value += self.advance() + self.advance()
-            if not (self.current() in "0123456789abcdefABCDEF"):
+            if self.current() not in _HEX_DIGITS:
                 self.add_error(
-                    "[C Error] Invalid hex literal – no digits after '0x'",
+                    f"{self._error_tag} Invalid hex literal – no digits after '0x'",
                     value, line, col,
                 )
                 return
-            while self.current() in "0123456789abcdefABCDEF_":
-                value += self.advance()
+            value += self._match_run(_HEX_RE)
             # hex float (C99)
             if self.current() == ".":
                 is_float = True
@@ -262,85 +344,77 @@ class CLexer(BaseLexer):
                 # Check for multiple decimal points
                 if self.current() == ".":
                     self.add_error(
-                        "[C Error] Malformed numeric literal – multiple decimal points",
+                        f"{self._error_tag} Malformed numeric literal – multiple decimal points",
                         value, line, col,
                     )
                     return
-                while self.current() in "0123456789abcdefABCDEF_":
-                    value += self.advance()
+                value += self._match_run(_HEX_RE)
             if self.current() in ("p", "P"):
                 is_float = True
                 value += self.advance()
                 if self.current() in ("+", "-"):
                     value += self.advance()
-                while self.current().isdigit():
-                    value += self.advance()
+                value += self._match_run(_DIGITS_RE)
             # suffix
-            while self.current() in "uUlLfF":
-                value += self.advance()
+            value += self._match_run(_SUFFIX_RE)
             self.add_token(FLOAT if is_float else INTEGER, value, line, col)
             return
 
         # Octal / Binary (C23 0b…)
         if self.current() == "0" and self.peek() in ("b", "B"):
             value += self.advance() + self.advance()
-            if self.current() not in "01":
+            if self.current() not in _BIN_DIGITS:
                 self.add_error(
-                    "[C Error] Invalid binary literal – no digits after '0b'",
+                    f"{self._error_tag} Invalid binary literal – no digits after '0b'",
                     value, line, col,
                 )
                 return
-            while self.current() in "01_":
-                value += self.advance()
-            while self.current() in "uUlL":
-                value += self.advance()
+            value += self._match_run(_BIN_RE)
+            value += self._match_run(_INT_SUFFIX_RE)
             self.add_token(INTEGER, value, line, col)
             return
 
         # Decimal / Float / Octal
-        while self.current().isdigit() or self.current() == "_":
-            value += self.advance()
+        value += self._match_run(_DEC_RE)
 
         if self.current() == "." and self.peek() != ".":
             is_float = True
             decimal_count += 1
             value += self.advance()
             # Check for multiple decimal points
-            if self.current() == "." and self.peek().isdigit():
+            if self.current() == "." and self.peek() in _DIGITS:
                 self.add_error(
-                    "[C Error] Malformed numeric literal – multiple decimal points",
+                    f"{self._error_tag} Malformed numeric literal – multiple decimal points",
                     value, line, col,
                 )
                 return
-            while self.current().isdigit():
-                value += self.advance()
+            value += self._match_run(_DIGITS_RE)
 
         if self.current() in ("e", "E"):
             is_float = True
             value += self.advance()
             if self.current() in ("+", "-"):
                 value += self.advance()
-            if not self.current().isdigit():
+            if self.current() not in _DIGITS:
                 self.add_error(
-                    "[C Error] Malformed float literal – expected digits after exponent",
+                    f"{self._error_tag} Malformed float literal – expected digits after exponent",
                     value, line, col,
                 )
                 return
-            while self.current().isdigit():
-                value += self.advance()
+            value += self._match_run(_DIGITS_RE)
 
         # suffix  f/F/l/L/u/U
-        while self.current() in "uUlLfF":
-            suffix = self.current()
-            if suffix in ("f", "F"):
+        suffix = self._match_run(_SUFFIX_RE)
+        if suffix:
+            if "f" in suffix or "F" in suffix:
                 is_float = True
-            value += self.advance()
+            value += suffix
 
         # Octal validation
         if not is_float and value.startswith("0") and len(value) > 1:
             if any(d in value for d in "89"):
                 self.add_error(
-                    f"[C Error] Invalid octal literal '{value}' – digits 8 or 9 are not valid in octal",
+                    f"{self._error_tag} Invalid octal literal '{value}' – digits 8 or 9 are not valid in octal",
                     value, line, col,
                 )
                 return
@@ -349,8 +423,28 @@ class CLexer(BaseLexer):
 
     # ── Identifier / keyword ──────────────────────────────────────────────
     def _read_identifier(self, line: int, col: int):
-        value = ""
-        while not self.at_end() and (self.current().isalnum() or self.current() == "_"):
-            value += self.advance()
+        # intern(): repeated occurrences of the same name share one str
+        # object, and downstream == compares short-circuit on identity.
+        value = intern(self._match_run(_IDENT_RE))
         ttype = KEYWORD if value in C_KEYWORDS else IDENTIFIER
         self.add_token(ttype, value, line, col)
+
+
+# ── Dispatch table ─────────────────────────────────────────────────────────
+# 256-entry table mapping ord(ch) → unbound handler, replacing the old
+# if/elif ladder (plus .isdigit()/.isalpha() calls) with one list index.
+_C_DISPATCH = [CLexer._scan_symbol] * 256
+for _ch in " \t\r\n":
+    _C_DISPATCH[ord(_ch)] = CLexer._scan_whitespace
+_C_DISPATCH[ord("#")] = CLexer._read_preprocessor
+_C_DISPATCH[ord("/")] = CLexer._scan_slash
+_C_DISPATCH[ord('"')] = CLexer._read_string
+_C_DISPATCH[ord("'")] = CLexer._read_char
+_C_DISPATCH[ord(".")] = CLexer._scan_dot
+for _ch in "0123456789":
+    _C_DISPATCH[ord(_ch)] = CLexer._read_number
+for _ch in "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_":
+    _C_DISPATCH[ord(_ch)] = CLexer._read_identifier
+for _ch in "LuU":
+    _C_DISPATCH[ord(_ch)] = CLexer._scan_str_prefix
+del _ch
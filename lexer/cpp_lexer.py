@@ -10,8 +10,15 @@ C++ Lexer  –  extends CLexer with:
   • Error messages labelled [C++ Error]
 """
 
-from .c_lexer import CLexer, C_OPERATORS
-from .tokens import KEYWORD, IDENTIFIER, INTEGER, FLOAT, STRING, BOOLEAN
+import re
+from sys import intern
+
+from .base_lexer import build_op_trie, match_operator
+from .c_lexer import CLexer, C_OPERATORS, _IDENT_RE, _NUM_CONT
+from .tokens import (
+    KEYWORD, IDENTIFIER, INTEGER, FLOAT, STRING, BOOLEAN,
+    OPERATOR, DELIMITER,
+)
 
 CPP_EXTRA_KEYWORDS = frozenset({
     # OOP / type system
@@ -40,7 +47,7 @@ CPP_EXTRA_KEYWORDS = frozenset({
 # Merge with C keywords for membership testing
 CPP_ALL_KEYWORDS: frozenset  # populated below
 
-from .c_lexer import C_KEYWORDS
+from .c_lexer import C_KEYWORDS, C_DELIMITERS
 CPP_ALL_KEYWORDS = C_KEYWORDS | CPP_EXTRA_KEYWORDS
 
 # C++ adds a few extra operators beyond C
@@ -48,10 +55,104 @@ CPP_EXTRA_OPS = ["->*", ".*", "::", "..."]
 
 ALL_CPP_OPERATORS = CPP_EXTRA_OPS + C_OPERATORS  # longest-first preference
 
+# Longest-match operator trie (see base_lexer.build_op_trie) – replaces the
+# ~34-entry linear slice-and-compare scan per symbol token.
+_CPP_OP_TRIE = build_op_trie(ALL_CPP_OPERATORS)
+
+# Master scanner: one alternation classifying the stateless token shapes,
+# tried first in the main loop so the regex engine does the dispatch in C.
+# Guards keep the stateful cases on the fallback path: '/' must not eat the
+# start of a comment, '.' must not eat the start of '.5', and '#', quotes
+# and anything non-ASCII simply fail to match.
+_CPP_MASTER = re.compile(
+    r"(?P<WS>[ \t\r\n]+)"
+    r"|(?P<NAME>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<NUM>[1-9][0-9]*)"
+    r"|(?P<OP>"
+    + "|".join(
+        r"/(?![/*])" if op == "/" else
+        r"\.(?!\d)" if op == "." else
+        re.escape(op)
+        for op in ALL_CPP_OPERATORS
+    )
+    + r")"
+    r"|(?P<DELIM>[(){};,\[\]:])"
+)
+
+# Raw-string prefixes with their opening quote baked in: one startswith
+# call with this tuple replaces the old slice-compare loop.
+_RAW_PREFIXES = ('LR"', 'uR"', 'UR"', 'u8R"')
+
+# One identifier-classification map: keywords and the boolean literals
+# resolve with a single dict probe (miss ⇒ plain identifier).
+_CPP_ID_MAP = {kw: KEYWORD for kw in CPP_ALL_KEYWORDS}
+_CPP_ID_MAP["true"] = BOOLEAN
+_CPP_ID_MAP["false"] = BOOLEAN
+
 
 class CppLexer(CLexer):
     """Lexer for the C++ programming language."""
 
+    _error_tag = "[C++ Error]"
+
+    def tokenize(self) -> dict:
+        src = self.source
+        n = len(src)
+        master = _CPP_MASTER.match
+        add_token = self.add_token
+        classify = _CPP_ID_MAP.get
+        while self.pos < n:
+            # Fast path: classify the token with one master-pattern match.
+            # A miss (comments, strings, preprocessor, floats/radix
+            # literals, unknown chars) falls back to the full dispatcher.
+            m = master(src, self.pos)
+            if m is None:
+                self._scan_token()
+                continue
+            kind = m.lastgroup
+            end = m.end()
+
+            if kind == "NAME":
+                nxt = src[end] if end < n else ""
+                if nxt == '"' or nxt == "'" or (nxt >= "\x80" and nxt.isalnum()):
+                    # String/char/raw prefix, or an identifier continuing
+                    # with a non-ASCII letter – both need the full reader.
+                    self._scan_token()
+                    continue
+                value = intern(m.group())
+                line, col = self.line, self.col
+                self.pos = end
+                self.col = col + len(value)
+                add_token(classify(value, IDENTIFIER), value, line, col)
+            elif kind == "WS":
+                newlines = src.count("\n", self.pos, end)
+                if newlines:
+                    self.line += newlines
+                    self.col = end - src.rfind("\n", self.pos, end)
+                else:
+                    self.col += end - self.pos
+                self.pos = end
+            elif kind == "OP":
+                value = intern(m.group())
+                add_token(OPERATOR, value, self.line, self.col)
+                self.pos = end
+                self.col += len(value)
+            elif kind == "NUM":
+                value = m.group()
+                nxt = src[end] if end < n else ""
+                if nxt and (nxt in _NUM_CONT or nxt.isalpha()):
+                    self._scan_token()     # float / suffix / UDL path
+                    continue
+                add_token(INTEGER, value, self.line, self.col)
+                self.pos = end
+                self.col += len(value)
+            else:  # DELIM
+                ch = m.group()
+                add_token(DELIMITER, ch, self.line, self.col)
+                self.pos = end
+                self.col += 1
+        return self._finalize()
+
     def _scan_token(self):
         if self.current() in (" ", "\t", "\r", "\n"):
             self.advance()
@@ -75,34 +176,38 @@ class CppLexer(CLexer):
             self._read_block_comment(line, col)
             return
 
+        src = self.source
+
         # ── raw string literal  R"tag(…)tag" ─────────────────────────────
-        if ch == "R" and self.peek() == '"':
+        if src.startswith('R"', self.pos):
+            self.advance()
             self._read_raw_string(line, col, prefix="R")
             return
 
-        # ── prefixed raw strings  LR"…"  u8R"…"  u16R"…"  etc. ──────────
-        for pfx in ("LR", "uR", "UR", "u8R"):
-            end = self.pos + len(pfx)
-            if self.source[self.pos:end] == pfx and (end < len(self.source) and self.source[end] == '"'):
-                for _ in pfx:
-                    self.advance()
-                self._read_raw_string(line, col, prefix=pfx)
-                return
+        # ── prefixed raw strings  LR"…"  u8R"…"  etc. ────────────────────
+        if src.startswith(_RAW_PREFIXES, self.pos):
+            prefix = "u8R" if src.startswith('u8R"', self.pos) else src[self.pos:self.pos + 2]
+            self.pos += len(prefix)
+            self.col += len(prefix)
+            self._read_raw_string(line, col, prefix=prefix)
+            return
 
         # ── prefixed string / char literals ───────────────────────────────
-        if ch in ("L", "u", "U") and self.peek() == '"':
-            prefix = ch
-            self.advance()
-            self._read_string(line, col, prefix=prefix)
-            return
-        if ch == "u" and self.peek() == "8" and self.peek(2) == '"':
-            self.advance(); self.advance()
-            self._read_string(line, col, prefix="u8")
-            return
-        if ch in ("L", "u", "U") and self.peek() == "'":
-            self.advance()
-            self._read_char(line, col)
-            return
+        if ch in ("L", "u", "U"):
+            if src.startswith('u8"', self.pos):
+                self.pos += 2
+                self.col += 2
+                self._read_string(line, col, prefix="u8")
+                return
+            nxt = self.peek()
+            if nxt == '"':
+                self.advance()
+                self._read_string(line, col, prefix=ch)
+                return
+            if nxt == "'":
+                self.advance()
+                self._read_char(line, col)
+                return
 
         # ── regular string ────────────────────────────────────────────────
         if ch == '"':
@@ -125,17 +230,14 @@ class CppLexer(CLexer):
             return
 
         # ── operators (C++ superset) ──────────────────────────────────────
-        for op in ALL_CPP_OPERATORS:
-            if self.source[self.pos: self.pos + len(op)] == op:
-                for _ in op:
-                    self.advance()
-                from .tokens import OPERATOR
-                self.add_token(OPERATOR, op, line, col)
-                return
+        op = match_operator(_CPP_OP_TRIE, self.source, self.pos)
+        if op is not None:
+            self.pos += len(op)
+            self.col += len(op)
+            self.add_token(OPERATOR, op, line, col)
+            return
 
         # ── delimiters ────────────────────────────────────────────────────
-        from .c_lexer import C_DELIMITERS
-        from .tokens import DELIMITER
         if ch in C_DELIMITERS:
             self.advance()
             self.add_token(DELIMITER, ch, line, col)
@@ -150,21 +252,17 @@ class CppLexer(CLexer):
 
     # ── Identifier / keyword (C++ keyword set) ────────────────────────────
     def _read_identifier_cpp(self, line: int, col: int):
-        value = ""
-        while not self.at_end() and (self.current().isalnum() or self.current() == "_"):
-            value += self.advance()
-        if value in ("true", "false"):
-            ttype = BOOLEAN
-        elif value in CPP_ALL_KEYWORDS:
-            ttype = KEYWORD
-        else:
-            ttype = IDENTIFIER
-        self.add_token(ttype, value, line, col)
+        value = intern(self._match_run(_IDENT_RE))
+        self.add_token(_CPP_ID_MAP.get(value, IDENTIFIER), value, line, col)
 
     # ── Raw string literal ────────────────────────────────────────────────
     def _read_raw_string(self, line: int, col: int, prefix: str = "R"):
-        """Parse  R"delimiter(content)delimiter"  """
-        self.advance()          # consume R
+        """
+        Parse  R"delimiter(content)delimiter".
+        The caller has consumed the whole prefix; pos is at the opening '"'.
+        """
+        src = self.source
+        start = self.pos - len(prefix)
         self.advance()          # consume "
         # collect delimiter (up to 16 chars, terminated by '(')
         delimiter = ""
@@ -172,7 +270,7 @@ class CppLexer(CLexer):
             if len(delimiter) >= 16:
                 self.add_error(
                     "[C++ Error] Raw string delimiter too long (max 16 characters)",
-                    prefix + '"' + delimiter,
+                    src[start:self.pos],
                     line, col,
                 )
                 return
@@ -181,44 +279,34 @@ class CppLexer(CLexer):
         if self.current() != "(":
             self.add_error(
                 "[C++ Error] Malformed raw string literal – expected '(' after delimiter",
-                prefix + '"' + delimiter,
+                src[start:self.pos],
                 line, col,
             )
             return
         self.advance()          # consume (
 
+        # Jump straight to the closing sequence with one C-level substring
+        # search instead of re-slicing/comparing on every character.
         closing = ")" + delimiter + '"'
-        content = prefix + '"' + delimiter + "("
-
-        while not self.at_end():
-            # look for closing sequence
-            end = self.pos + len(closing)
-            if self.source[self.pos:end] == closing:
-                content += closing
-                for _ in closing:
-                    self.advance()
-                self.add_token(STRING, content, line, col)
-                return
-            content += self.advance()
-
-        self.add_error(
-            f"[C++ Error] Unterminated raw string literal – expected ')%s\"'" % delimiter,
-            content, line, col,
-        )
+        end = src.find(closing, self.pos)
+        if end == -1:
+            content = src[start:]
+            self.advance_to(len(src))
+            self.add_error(
+                f"[C++ Error] Unterminated raw string literal – expected ')%s\"'" % delimiter,
+                content, line, col,
+            )
+            return
+        stop = end + len(closing)
+        self.advance_to(stop)
+        self.add_token(STRING, src[start:stop], line, col)
 
-    # Override _read_number to give C++ error messages and handle UDL suffixes
+    # Override _read_number to handle UDL suffixes; error messages already
+    # carry the C++ tag via _error_tag.
     def _read_number(self, line: int, col: int):
         # Delegate to parent
         super()._read_number(line, col)
-        # Replace any error messages to say [C++ Error] instead of [C Error]
-        for tok in self.tokens[-3:]:
-            if tok.get("type") == "ERROR":
-                tok["message"] = tok.get("message", "").replace("[C Error]", "[C++ Error]")
         # Handle user-defined literal suffix (C++11): starts with _
-        last = self.tokens[-1] if self.tokens else None
-        if last and last["type"] in (INTEGER, FLOAT, STRING):
+        if self._types and self._types[-1] in (INTEGER, FLOAT, STRING):
             if not self.at_end() and (self.current() == "_" or self.current().isalpha()):
-                udl = ""
-                while not self.at_end() and (self.current().isalnum() or self.current() == "_"):
-                    udl += self.advance()
-                last["value"] += udl
+                self._values[-1] += self._match_run(_IDENT_RE)
@@ -9,6 +9,7 @@ Languages supported: c, cpp, python
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 
@@ -101,15 +102,59 @@ _PYTHON_WEAK = [
 ]
 
 
-def _score(source: str, strong_patterns: list, weak_patterns: list) -> int:
-    score = 0
-    for p in strong_patterns:
-        if re.search(p, source, re.MULTILINE):
-            score += 3
-    for p in weak_patterns:
-        if re.search(p, source, re.MULTILINE):
-            score += 1
-    return score
+# All tiers fused into one alternation scanned in a single pass: scoring
+# previously ran ~60 independent re.search calls, i.e. up to 60 full
+# sweeps of the source. Each pattern keeps its (language, weight) via its
+# group index. Because alternation matches consume their span, a pattern
+# overlapping another's match can be shadowed in the fused pass – so it
+# is used as a prefilter only, and patterns it did not see fall back to
+# their individual compiled search, keeping the scores exact.
+_ALL_PATTERNS = (
+    [("cpp",    3, p) for p in _CPP_STRONG]
+    + [("c",      3, p) for p in _C_STRONG]
+    + [("python", 3, p) for p in _PYTHON_STRONG]
+    + [("cpp",    1, p) for p in _CPP_WEAK]
+    + [("c",      1, p) for p in _C_WEAK]
+    + [("python", 1, p) for p in _PYTHON_WEAK]
+)
+_ALL_RE = re.compile(
+    "|".join(f"(?P<g{i}>{p})" for i, (_, _, p) in enumerate(_ALL_PATTERNS)),
+    re.MULTILINE,
+)
+_ALL_PATTERNS = [
+    (lang, weight, re.compile(p, re.MULTILINE)) for lang, weight, p in _ALL_PATTERNS
+]
+
+
+# Trip patterns: constructs exclusive enough to settle detection on their
+# own. 'class' is deliberately absent from the Python trip – C++ headers
+# like `class Foo : public Bar {` match the colon form too – so only
+# genuinely Python-exclusive openings qualify; there is no C trip because
+# C evidence never rules out C++.
+_PY_TRIP = re.compile(r"^\s*(?:def \w|from \w+ import )", re.MULTILINE)
+_CPP_TRIP = re.compile(
+    r"\bnamespace\b|\btemplate\s*<|\bstd\s*::|\bnullptr\b|\bcout\b"
+)
+_C_TRIP = re.compile(r"#include|\bprintf\s*\(")
+
+# C++-exclusive tie-break features fused into one alternation: only
+# presence matters, so a single search replaces six per-pattern scans
+# (which also re-entered the re module's pattern cache on every call).
+_CPP_EXCLUSIVE_RE = re.compile(
+    r"::|\bnamespace\b|\btemplate\b|\bcout\b|\bnullptr\b|\boverride\b"
+)
+
+
+def _score_all(source: str) -> dict:
+    """Accumulate all three languages' scores, fused scan first."""
+    scores = {"cpp": 0, "c": 0, "python": 0}
+    seen = set()
+    for m in _ALL_RE.finditer(source):
+        seen.add(int(m.lastgroup[1:]))
+    for i, (lang, weight, pattern) in enumerate(_ALL_PATTERNS):
+        if i in seen or pattern.search(source):
+            scores[lang] += weight
+    return scores
 
 
 class LanguageDetector:
@@ -131,54 +176,64 @@ class LanguageDetector:
         Returns (language, confidence).
         confidence is one of: "high", "medium", "low", "none"
         """
-        if not source or not source.strip():
-            return LanguageDetector.UNKNOWN, "none"
-
-        scores = {
-            "cpp":    _score(source, _CPP_STRONG,    _CPP_WEAK),
-            "c":      _score(source, _C_STRONG,      _C_WEAK),
-            "python": _score(source, _PYTHON_STRONG, _PYTHON_WEAK),
-        }
-
-        # C++ is a superset of C; if both score > 0,
-        # presence of any C++ exclusive feature breaks the tie toward C++.
-        cpp_exclusive = [r"::", r"\bnamespace\b", r"\btemplate\b",
-                         r"\bcout\b", r"\bnullptr\b", r"\boverride\b"]
-        if any(re.search(p, source) for p in cpp_exclusive):
-            scores["cpp"] += 5
-
-        best_lang  = max(scores, key=lambda k: scores[k])
-        best_score = scores[best_lang]
-
-        if best_score == 0:
-            return LanguageDetector.UNKNOWN, "none"
-
-        # Confidence based on score gap and absolute score
-        second_best = sorted(scores.values(), reverse=True)[1]
-        gap = best_score - second_best
-
-        if best_score >= 9 and gap >= 3:
-            confidence = "high"
-        elif best_score >= 5 or gap >= 2:
-            confidence = "medium"
-        else:
-            confidence = "low"
-
-        return best_lang, confidence
+        # Cheap short-circuit: an unambiguous language-exclusive construct
+        # settles detection with one or two scans instead of full scoring.
+        if source and source.strip():
+            cpp_trip = _CPP_TRIP.search(source)
+            py_trip  = _PY_TRIP.search(source)
+            if cpp_trip and not py_trip:
+                return "cpp", "high"
+            if py_trip and not cpp_trip and not _C_TRIP.search(source):
+                return "python", "high"
+        lang, conf, _scores = _detect(source)
+        return lang, conf
 
     @staticmethod
     def detect_and_explain(source: str) -> dict:
         """
         Returns a detailed dict with language, confidence, and per-language scores.
         """
-        lang, conf = LanguageDetector.detect(source)
-        scores = {
-            "cpp":    _score(source, _CPP_STRONG,    _CPP_WEAK),
-            "c":      _score(source, _C_STRONG,      _C_WEAK),
-            "python": _score(source, _PYTHON_STRONG, _PYTHON_WEAK),
-        }
+        lang, conf, scores = _detect(source)
         return {
             "detected_language": lang,
             "confidence":        conf,
-            "scores":            scores,
+            "scores":            dict(scores),   # copy – cached dict stays pristine
         }
+
+
+@lru_cache(maxsize=256)
+def _detect(source: str) -> tuple[str, str, dict]:
+    """
+    Single scoring pass shared by detect() and detect_and_explain().
+    Memoized so repeated submissions of the same source (including the
+    detect-then-explain sequence in the API) only scan the source once.
+    Returns (language, confidence, scores).
+    """
+    if not source or not source.strip():
+        return LanguageDetector.UNKNOWN, "none", {"cpp": 0, "c": 0, "python": 0}
+
+    scores = _score_all(source)
+
+    # C++ is a superset of C; if both score > 0,
+    # presence of any C++ exclusive feature breaks the tie toward C++.
+    if _CPP_EXCLUSIVE_RE.search(source):
+        scores["cpp"] += 5
+
+    best_lang  = max(scores, key=lambda k: scores[k])
+    best_score = scores[best_lang]
+
+    if best_score == 0:
+        return LanguageDetector.UNKNOWN, "none", scores
+
+    # Confidence based on score gap and absolute score
+    second_best = sorted(scores.values(), reverse=True)[1]
+    gap = best_score - second_best
+
+    if best_score >= 9 and gap >= 3:
+        confidence = "high"
+    elif best_score >= 5 or gap >= 2:
+        confidence = "medium"
+    else:
+        confidence = "low"
+
+    return best_lang, confidence, scores
@@ -14,7 +14,10 @@ Python Lexer  –  fully handles:
   • Specific [Python Error] messages
 """
 
-from .base_lexer import BaseLexer
+import re
+from sys import intern
+
+from .base_lexer import BaseLexer, build_op_trie, match_operator
 from .tokens import (
     KEYWORD, IDENTIFIER, INTEGER, FLOAT, STRING, F_STRING,
     OPERATOR, DELIMITER, BOOLEAN, NONE_TOKEN, NEWLINE,
@@ -45,6 +48,54 @@ PY_OPERATORS = [
 
 PY_DELIMITERS = set("(){}[];,:#\\")
 
+# Longest-match operator trie (see base_lexer.build_op_trie) – replaces the
+# linear slice-and-compare scan over PY_OPERATORS per symbol token.
+_PY_OP_TRIE = build_op_trie(PY_OPERATORS)
+
+# One identifier-classification map: keywords, booleans and None all
+# resolve with a single dict probe (miss ⇒ plain identifier).
+_PY_ID_MAP = {kw: KEYWORD for kw in PY_KEYWORDS}
+_PY_ID_MAP.update({"True": BOOLEAN, "False": BOOLEAN, "None": NONE_TOKEN})
+
+# Master scanner: one alternation covering the token shapes that need no
+# lookahead state, tried first on every iteration of the main loop. The
+# regex engine does the dispatch in C; anything stateful (strings, floats,
+# comments, continuations) deliberately fails to match and falls back to
+# _scan_token. The '.' operator is guarded so '.5' still reaches the
+# number reader; ':' is absent from the operator list, so ':=' wins via
+# ordering and a bare ':' falls through to the delimiter group.
+_PY_MASTER = re.compile(
+    r"(?P<WS>[ \t]+)"
+    r"|(?P<NL>\r\n|[\r\n])"
+    r"|(?P<NAME>[A-Za-z_]\w*)"
+    r"|(?P<NUM>[0-9][0-9_]*)"
+    r"|(?P<OP>"
+    + "|".join(r"\.(?!\d)" if op == "." else re.escape(op) for op in PY_OPERATORS)
+    + r")"
+    r"|(?P<DELIM>[()\[\]{};,:])"
+)
+
+# Precompiled run scanners – consume a whole identifier / digit run in one
+# C-level match instead of one Python-level advance() per character.
+# \w keeps the Unicode-identifier semantics of the old isalnum() loop.
+_IDENT_RE  = re.compile(r"\w+")
+_INDENT_RE = re.compile(r"[ \t]+")
+_PY_DEC_RE = re.compile(r"[0-9_]+")
+_PY_HEX_RE = re.compile(r"[0-9a-fA-F_]+")
+_PY_OCT_RE = re.compile(r"[0-7_]+")
+_PY_BIN_RE = re.compile(r"[01_]+")
+
+# Single-character class sets: one hashed membership test instead of a
+# substring scan over a literal string per probe.
+_PY_HEX_DIGITS = frozenset("0123456789abcdefABCDEF_")
+_PY_OCT_DIGITS = frozenset("01234567_")
+_PY_BIN_DIGITS = frozenset("01_")
+_PY_DIGITS     = frozenset("0123456789")
+
+# Deletion table for digit separators – translate with a prebuilt table
+# beats replace('_', '') on the short strings seen here.
+_UNDERSCORE_DEL = str.maketrans("", "", "_")
+
 STRING_PREFIXES = frozenset({
     "r", "R", "b", "B", "f", "F",
     "rb", "rB", "Rb", "RB", "br", "bR", "Br", "BR",
@@ -52,6 +103,31 @@ STRING_PREFIXES = frozenset({
     "u", "U",
 })
 
+# Two-level prefix trie: first char → [valid as 1-char prefix?, set of
+# valid second chars]. _try_string_prefix then works on bounded single
+# char loads instead of slicing and case-folding candidate substrings
+# (STRING_PREFIXES already enumerates every case variant).
+_PREFIX_TRIE: dict = {}
+for _p in STRING_PREFIXES:
+    node = _PREFIX_TRIE.setdefault(_p[0], [False, set()])
+    if len(_p) == 1:
+        node[0] = True
+    else:
+        node[1].add(_p[1])
+del _p, node
+
+# Per-closing string-body scanners: consume the whole run of ordinary body
+# characters in one C-level match, stopping only at a backslash, a
+# possible terminator, or (single-quoted forms) a newline. In the triple
+# forms a lone quote is body unless it starts the closing run – the same
+# positions the per-char loop treated as closings.
+_STR_BODY = {
+    '"':   re.compile(r'[^"\\\n\r]+'),
+    "'":   re.compile(r"[^'\\\n\r]+"),
+    '"""': re.compile(r'(?:[^"\\]|"(?!""))+'),
+    "'''": re.compile(r"(?:[^'\\]|'(?!''))+"),
+}
+
 
 class PythonLexer(BaseLexer):
     """Lexer for the Python 3 programming language."""
@@ -61,42 +137,126 @@ class PythonLexer(BaseLexer):
         self._at_line_start = True
         self._paren_depth = 0          # inside () [] {} → no INDENT/DEDENT
 
-        while not self.at_end():
+        src = self.source
+        n = len(src)
+        master = _PY_MASTER.match
+        add_token = self.add_token
+        classify = _PY_ID_MAP.get
+
+        while self.pos < n:
             if self._at_line_start and self._paren_depth == 0:
                 self._handle_indentation()
-            self._scan_token()
+                if self.pos >= n:
+                    break
+
+            # Fast path: let the master pattern classify the token in one
+            # C-level match. A miss (strings, comments, floats, '\', '#',
+            # non-ASCII …) falls through to the full dispatcher.
+            m = master(src, self.pos)
+            if m is None:
+                self._scan_token()
+                continue
+            kind = m.lastgroup
+            end = m.end()
+
+            if kind == "NAME":
+                nxt = src[end] if end < n else ""
+                if nxt == '"' or nxt == "'":
+                    self._scan_token()     # may be a string prefix (f"…", rb'…')
+                    continue
+                value = intern(m.group())
+                line, col = self.line, self.col
+                self.pos = end
+                self.col = col + len(value)
+                add_token(classify(value, IDENTIFIER), value, line, col)
+            elif kind == "WS":
+                self.col += end - self.pos
+                self.pos = end
+            elif kind == "NL":
+                text = m.group()
+                self.pos = end
+                if text == "\r":           # lone CR: advance() treats it as plain
+                    self.col += 1
+                else:
+                    self.line += 1
+                    self.col = 1
+                self._at_line_start = True
+            elif kind == "OP":
+                value = intern(m.group())
+                add_token(OPERATOR, value, self.line, self.col)
+                self.pos = end
+                self.col += len(value)
+            elif kind == "NUM":
+                value = m.group()
+                nxt = src[end] if end < n else ""
+                if (nxt and (nxt == "." or nxt.isalnum())) or (
+                    value[0] == "0" and len(value) > 1 and value[1].isdigit()
+                ):
+                    self._scan_token()     # float / exponent / radix / error path
+                    continue
+                add_token(INTEGER, value, self.line, self.col)
+                self.pos = end
+                self.col += len(value)
+            else:  # DELIM
+                ch = m.group()
+                line, col = self.line, self.col
+                if ch in "([{":
+                    self._paren_depth += 1
+                elif ch in ")]}":
+                    if self._paren_depth > 0:
+                        self._paren_depth -= 1
+                    else:
+                        self.add_error(
+                            f"[Python Error] Unmatched closing bracket '{ch}'",
+                            ch, line, col,
+                        )
+                self.pos = end
+                self.col = col + 1
+                add_token(DELIMITER, ch, line, col)
 
         # Emit remaining DEDENTs
-        while len(self._indent_stack) > 1:
-            self._indent_stack.pop()
-            self.add_token(DEDENT, "", self.line, self.col)
+        stack = self._indent_stack
+        while len(stack) > 1:
+            stack.pop()
+            self._types.append(DEDENT)
+            self._values.append("")
+            self._lines.append(self.line)
+            self._cols.append(self.col)
 
-        return {
-            "tokens": [t for t in self.tokens if t["type"] not in ("COMMENT",)],
-            "errors": self.errors,
-        }
+        return self._finalize()
 
     # ── Indentation ────────────────────────────────────────────────────────
     def _handle_indentation(self):
         """Process leading whitespace on a new logical line."""
-        indent_col = 0
-        while self.current() in (" ", "\t"):
-            indent_col += 1 if self.current() == " " else 4   # tab = 4 spaces
-            self.advance()
+        # Measure the whole leading run in one match: each space counts 1,
+        # each tab 4, so the width is len + 3 per tab.
+        ws = self._match_run(_INDENT_RE)
+        indent_col = len(ws) + 3 * ws.count("\t")
 
         # blank line or comment – skip
         if self.current() in ("\n", "\r", "#", ""):
             return
 
-        current_indent = self._indent_stack[-1]
+        # INDENT/DEDENT carry no text, so append straight onto the token
+        # columns instead of going through add_token per level.
+        stack = self._indent_stack
+        current_indent = stack[-1]
         if indent_col > current_indent:
-            self._indent_stack.append(indent_col)
-            self.add_token(INDENT, "", self.line, 1)
+            stack.append(indent_col)
+            self._types.append(INDENT)
+            self._values.append("")
+            self._lines.append(self.line)
+            self._cols.append(1)
         elif indent_col < current_indent:
-            while self._indent_stack and self._indent_stack[-1] > indent_col:
-                self._indent_stack.pop()
-                self.add_token(DEDENT, "", self.line, 1)
-            if not self._indent_stack or self._indent_stack[-1] != indent_col:
+            types, values, lines, cols = self._types, self._values, self._lines, self._cols
+            line = self.line
+            while stack and stack[-1] > indent_col:
+                stack.pop()
+                types.append(DEDENT)
+                values.append("")
+                lines.append(line)
+                cols.append(1)
+            if not stack or stack[-1] != indent_col:
                 self.add_error(
                     "[Python Error] Indentation error – unindent does not match any outer indentation level",
                     "", self.line, 1,
@@ -150,12 +310,12 @@ class PythonLexer(BaseLexer):
             return
 
         # ── operators ─────────────────────────────────────────────────────
-        for op in PY_OPERATORS:
-            if self.source[self.pos: self.pos + len(op)] == op:
-                for _ in op:
-                    self.advance()
-                self.add_token(OPERATOR, op, line, col)
-                return
+        op = match_operator(_PY_OP_TRIE, self.source, self.pos)
+        if op is not None:
+            self.pos += len(op)
+            self.col += len(op)
+            self.add_token(OPERATOR, op, line, col)
+            return
 
         # ── delimiters ─────────────────────────────────────────────────────
         if ch in PY_DELIMITERS:
@@ -186,14 +346,21 @@ class PythonLexer(BaseLexer):
         Look ahead to detect a string prefix (r, b, f, rb, …) followed by
         a quote character.  Returns the prefix string or None.
         """
-        for length in (3, 2, 1):
-            candidate = self.source[self.pos: self.pos + length]
-            if candidate.lower() in {p.lower() for p in STRING_PREFIXES}:
-                rest = self.pos + length
-                if rest < len(self.source) and self.source[rest] in ('"', "'"):
-                    # also check for triple quotes
-                    return candidate
-        if self.current() in ('"', "'"):
+        src = self.source
+        pos = self.pos
+        n = len(src)
+        ch = src[pos]
+        node = _PREFIX_TRIE.get(ch)
+        if node is not None:
+            one_char, seconds = node
+            nxt = src[pos + 1] if pos + 1 < n else ""
+            if nxt in seconds:                 # longest match first (rb, fR, …)
+                quote = src[pos + 2] if pos + 2 < n else ""
+                if quote == '"' or quote == "'":
+                    return src[pos:pos + 2]
+            if one_char and (nxt == '"' or nxt == "'"):
+                return ch
+        if ch == '"' or ch == "'":
             return ""
         return None
 
@@ -228,18 +395,34 @@ class PythonLexer(BaseLexer):
         is_fstring = "f" in prefix.lower()
         value = prefix + (quote_char * 3 if triple else quote_char)
 
-        while not self.at_end():
+        # Hoist everything the loop touches: each iteration otherwise pays
+        # several LOAD_ATTR + method-call dispatches per character.
+        src = self.source
+        n = len(src)
+        startswith = src.startswith
+        advance = self.advance
+        body = _STR_BODY[closing].match
+
+        while self.pos < n:
+            # Swallow the run of ordinary body characters in one match;
+            # the rest of the loop only handles whatever stopped it.
+            m = body(src, self.pos)
+            if m is not None:
+                value += m.group()
+                self.advance_to(m.end())
+                if self.pos >= n:
+                    break
+
             # Check closing
-            end = self.pos + len(closing)
-            if self.source[self.pos:end] == closing:
+            if startswith(closing, self.pos):
                 value += closing
                 for _ in closing:
-                    self.advance()
+                    advance()
                 ttype = F_STRING if is_fstring else STRING
                 self.add_token(ttype, value, line, col)
                 return
 
-            ch = self.current()
+            ch = src[self.pos]
             if not triple and ch in ("\n", "\r"):
                 self.add_error(
                     f"[Python Error] Unterminated string literal (single-line string cannot span multiple lines)",
@@ -248,11 +431,11 @@ class PythonLexer(BaseLexer):
                 return
 
             if ch == "\\" and not is_raw:
-                self.advance()
+                advance()
                 value += self._read_escape(self.line, self.col)
                 continue
 
-            value += self.advance()
+            value += advance()
 
         self.add_error(
             f"[Python Error] Unterminated {'triple-quoted ' if triple else ''}string literal – reached end of file",
@@ -268,54 +451,49 @@ class PythonLexer(BaseLexer):
         # Hex
         if self.current() == "0" and self.peek() in ("x", "X"):
             value += self.advance() + self.advance()
-            if self.current() not in "0123456789abcdefABCDEF_":
+            if self.current() not in _PY_HEX_DIGITS:
                 self.add_error(
                     "[Python Error] Invalid hexadecimal literal – no digits after '0x'",
                     value, line, col,
                 )
                 return
-            while self.current() in "0123456789abcdefABCDEF_":
-                value += self.advance()
+            value += self._match_run(_PY_HEX_RE)
             self.add_token(INTEGER, value, line, col)
             return
 
         # Binary
         if self.current() == "0" and self.peek() in ("b", "B"):
             value += self.advance() + self.advance()
-            if self.current() not in "01_":
+            if self.current() not in _PY_BIN_DIGITS:
                 self.add_error(
                     "[Python Error] Invalid binary literal – no digits after '0b'",
                     value, line, col,
                 )
                 return
-            while self.current() in "01_":
-                value += self.advance()
+            value += self._match_run(_PY_BIN_RE)
             self.add_token(INTEGER, value, line, col)
             return
 
         # Octal
         if self.current() == "0" and self.peek() in ("o", "O"):
             value += self.advance() + self.advance()
-            if self.current() not in "01234567_":
+            if self.current() not in _PY_OCT_DIGITS:
                 self.add_error(
                     "[Python Error] Invalid octal literal – no digits after '0o'",
                     value, line, col,
                 )
                 return
-            while self.current() in "01234567_":
-                value += self.advance()
+            value += self._match_run(_PY_OCT_RE)
             self.add_token(INTEGER, value, line, col)
             return
 
         # Decimal / float
-        while self.current().isdigit() or self.current() == "_":
-            value += self.advance()
+        value += self._match_run(_PY_DEC_RE)
 
         if self.current() == "." and self.peek() != ".":
             is_float = True
             value += self.advance()
-            while self.current().isdigit() or self.current() == "_":
-                value += self.advance()
+            value += self._match_run(_PY_DEC_RE)
 
         if self.current() in ("e", "E"):
             is_float = True
@@ -328,8 +506,7 @@ class PythonLexer(BaseLexer):
                     value, line, col,
                 )
                 return
-            while self.current().isdigit() or self.current() == "_":
-                value += self.advance()
+            value += self._match_run(_PY_DEC_RE)
 
         # Complex  j / J
         if self.current() in ("j", "J"):
@@ -345,13 +522,11 @@ class PythonLexer(BaseLexer):
             )
             return
 
-        # Check for numeric overflow
-        if not is_complex:
+        # Validate float forms only: Python ints are arbitrary precision,
+        # so the old int() round-trip could never fail for them.
+        if is_float and not is_complex:
             try:
-                if is_float:
-                    float(value.replace('_', ''))
-                else:
-                    int(value.replace('_', ''))
+                float(value.translate(_UNDERSCORE_DEL))
             except (ValueError, OverflowError):
                 self.add_error(
                     f"[Python Error] Numeric overflow – constant value too large for internal representation",
@@ -364,16 +539,5 @@ class PythonLexer(BaseLexer):
 
     # ── Identifier / keyword ──────────────────────────────────────────────
     def _read_identifier(self, line: int, col: int):
-        value = ""
-        while not self.at_end() and (self.current().isalnum() or self.current() == "_"):
-            value += self.advance()
-
-        if value in ("True", "False"):
-            ttype = BOOLEAN
-        elif value == "None":
-            ttype = NONE_TOKEN
-        elif value in PY_KEYWORDS:
-            ttype = KEYWORD
-        else:
-            ttype = IDENTIFIER
-        self.add_token(ttype, value, line, col)
+        value = intern(self._match_run(_IDENT_RE))
+        self.add_token(_PY_ID_MAP.get(value, IDENTIFIER), value, line, col)
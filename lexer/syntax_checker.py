@@ -14,11 +14,14 @@ Python:
   • Unmatched / unclosed  ( [ {
   • Extra closing          ) ] }
 
-Each error dict matches the format used everywhere else:
+Each error is a Token (see tokens.Token); its as_dict() yields the usual
   { "type": "ERROR", "value": ..., "line": n, "column": n, "message": "..." }
 """
 
-from .tokens import make_error, KEYWORD, OPERATOR, DELIMITER, PREPROCESSOR
+from .tokens import (
+    make_error, ERROR, KEYWORD, OPERATOR, DELIMITER, PREPROCESSOR,
+    INDENT, DEDENT, NEWLINE,
+)
 
 # ── helpers ────────────────────────────────────────────────────────────────
 
@@ -26,43 +29,144 @@ def _err(msg, value, line, col):
     return make_error(msg, value, line, col)
 
 
+# Bracket table shared by both checkers: value → (+1 open / -1 close, opener).
+# A single dict probe replaces the opener/closer membership tests plus the
+# pairs[] lookup per delimiter token.
+_BRK = {
+    "(": (1, "("), "[": (1, "["), "{": (1, "{"),
+    ")": (-1, "("), "]": (-1, "["), "}": (-1, "{"),
+}
+
+
+def _iter_bracket_errors(tokens: list, prefix: str):
+    """
+    Standalone bracket matcher: yields the bracket errors for a token
+    stream, prefixed with *prefix*. iter_c_errors deliberately keeps its
+    own copy of this logic, fused into its line-grouping pass so C input
+    is still walked only once.
+    """
+    msg_unexpected = prefix + " Unexpected '{}' – no matching '{}'"
+    msg_mismatched = (prefix + " Mismatched bracket: '{}' at line {} "
+                      "does not close '{}' opened at line {}")
+    msg_unclosed = prefix + " Unclosed '{}' – missing matching closing bracket"
+
+    # Preallocated-buffer + cursor stack (see iter_c_errors).
+    buf = [None] * 64
+    top = 0
+
+    delimiter_t = DELIMITER
+    brk_get = _BRK.get
+
+    # Interned type constants make this a single pointer compare per
+    # non-delimiter token. ERROR tokens fail it too, so they need no
+    # separate branch.
+    for tok in tokens:
+        if tok.type is not delimiter_t:
+            continue
+        v = tok.value
+        info = brk_get(v)
+        if info is None:
+            continue
+        kind, expected = info
+        if kind > 0:
+            if top == len(buf):
+                buf.extend([None] * top)
+            buf[top] = (v, tok.line, tok.column)
+            top += 1
+        else:
+            if not top:
+                yield _err(
+                    msg_unexpected.format(v, expected),
+                    v, tok.line, tok.column,
+                )
+            elif buf[top - 1][0] != expected:
+                op, ol, oc = buf[top - 1]
+                yield _err(
+                    msg_mismatched.format(v, tok.line, op, ol),
+                    v, tok.line, tok.column,
+                )
+                top -= 1
+            else:
+                top -= 1
+
+    for (ch, line, col) in buf[:top]:
+        yield _err(msg_unclosed.format(ch), ch, line, col)
+
+
 # ══════════════════════════════════════════════════════════════════════════
 #  C / C++
 # ══════════════════════════════════════════════════════════════════════════
 
+# All of the lookup sets below are frozensets: hashed once at module load
+# and immutable, which documents that nothing mutates them at runtime.
+
 # Token types that can legitimately END a statement
-_STMT_END_TYPES = {"IDENTIFIER", "INTEGER", "FLOAT", "STRING", "CHAR",
-                   "BOOLEAN", "NONE"}
+_STMT_END_TYPES = frozenset({"IDENTIFIER", "INTEGER", "FLOAT", "STRING",
+                             "CHAR", "BOOLEAN", "NONE"})
 
 # Delimiter values that, when last on a line, may end a statement
-_STMT_END_DELIMS = {")", "]"}
+_STMT_END_DELIMS = frozenset({")", "]"})
 
 # Operator values that end a statement  (post-increment / post-decrement)
-_STMT_END_OPS = {"++", "--"}
+_STMT_END_OPS = frozenset({"++", "--"})
 
 # Keywords that START a new line but do NOT themselves need a semicolon
 # before them (so the previous line without `;` is fine if it's the
 # header of a block-statement).
-_BLOCK_STARTERS = {
+_BLOCK_STARTERS = frozenset({
     "if", "else", "for", "while", "do", "switch",
     "try", "catch", "finally",
     # C++ class / namespace / struct headers
     "class", "namespace", "struct", "union", "enum",
     "public", "private", "protected",
     # preprocessor-like tokens are already their own type
-}
+})
 
 # Lines whose last real token is one of these do NOT need a semicolon.
-_NO_SEMI_LAST_KW = {
+_NO_SEMI_LAST_KW = frozenset({
     "if", "else", "for", "while", "do", "switch",
     "class", "namespace", "struct", "union", "enum",
     "try", "catch", "finally",
     "public", "private", "protected",
     "default",
-}
+})
 
 # Keywords that DO need a semicolon after their line
-_NEEDS_SEMI_KW = {"return", "break", "continue", "goto", "throw", "delete"}
+_NEEDS_SEMI_KW = frozenset({"return", "break", "continue", "goto",
+                            "throw", "delete"})
+
+# The semicolon rule classifies the LAST token of a line. The decision is
+# precomputed into one (type, value) lookup with a per-type fallback, so
+# the per-line code runs a dict probe or two instead of the branch chain
+# over the sets above. A token absent from both maps is simply skipped.
+_SEMI_OK, _SEMI_NEEDS, _SEMI_MAYBE = 0, 1, 2
+
+_LAST_CLASS = {}
+for _v in (";", "{", "}", ",", ":"):
+    _LAST_CLASS[(DELIMITER, _v)] = _SEMI_OK
+for _v in _STMT_END_DELIMS:
+    _LAST_CLASS[(DELIMITER, _v)] = _SEMI_MAYBE   # call vs. `if (…)` header
+for _v in _NO_SEMI_LAST_KW:
+    _LAST_CLASS[(KEYWORD, _v)] = _SEMI_OK
+for _v in _NEEDS_SEMI_KW:
+    _LAST_CLASS[(KEYWORD, _v)] = _SEMI_NEEDS
+for _v in _STMT_END_OPS:
+    _LAST_CLASS[(OPERATOR, _v)] = _SEMI_NEEDS
+del _v
+
+_LAST_CLASS_BY_TYPE = {_t: _SEMI_NEEDS for _t in _STMT_END_TYPES}
+# Any other trailing operator bridges to the next line (e.g.  +  &&  =).
+_LAST_CLASS_BY_TYPE[OPERATOR] = _SEMI_OK
+
+# 2D decision table: _NEEDS_SEMI[last_cls][line starts with a header kw].
+# The verdict is one indexed read; only the MAYBE row (trailing ')' or
+# ']') depends on the line header, so that is the only case where the
+# first keyword is looked up at all.
+_NEEDS_SEMI = (
+    (False, False),   # _SEMI_OK    – never needs one
+    (True,  True),    # _SEMI_NEEDS – always does
+    (True,  False),   # _SEMI_MAYBE – call needs one, `if (…)` header not
+)
 
 
 def check_c_syntax(tokens: list, lang: str = "C") -> list:
@@ -70,130 +174,130 @@ def check_c_syntax(tokens: list, lang: str = "C") -> list:
     Check token stream for C / C++ structural errors.
     Returns a list of error dicts.
     """
-    errors = []
-    prefix = f"[{lang} Error]"
+    return list(iter_c_errors(tokens, lang))
 
-    # ── 1. Bracket matching ────────────────────────────────────────────
-    stack = []          # each entry: (char, line, col)
-    pairs = {")": "(", "]": "[", "}": "{"}
-    openers = set("([{")
-    closers = set(")]}")
 
-    for tok in tokens:
-        if tok["type"] == "ERROR":
-            continue
-        if tok["type"] == DELIMITER:
-            v = tok["value"]
-            if v in openers:
-                stack.append((v, tok["line"], tok["column"]))
-            elif v in closers:
-                expected = pairs[v]
-                if not stack:
-                    errors.append(_err(
-                        f"{prefix} Unexpected '{v}' – no matching '{expected}'",
-                        v, tok["line"], tok["column"],
-                    ))
-                elif stack[-1][0] != expected:
-                    op, ol, oc = stack[-1]
-                    errors.append(_err(
-                        f"{prefix} Mismatched bracket: '{v}' at line {tok['line']} "
-                        f"does not close '{op}' opened at line {ol}",
-                        v, tok["line"], tok["column"],
-                    ))
-                    stack.pop()
-                else:
-                    stack.pop()
+def iter_c_errors(tokens: list, lang: str = "C"):
+    """
+    Yield C / C++ structural errors as they are found. Callers that only
+    need "is this file valid?" can stop at the first error without
+    materializing the rest.
+    """
+    prefix = f"[{lang} Error]"
 
-    for (ch, line, col) in stack:
-        errors.append(_err(
-            f"{prefix} Unclosed '{ch}' – missing matching closing bracket",
-            ch, line, col,
-        ))
+    # Message templates built once per call; each emitted error is a
+    # single .format (or none) instead of assembling the f-string parts
+    # every time.
+    msg_unexpected = prefix + " Unexpected '{}' – no matching '{}'"
+    msg_mismatched = (prefix + " Mismatched bracket: '{}' at line {} "
+                      "does not close '{}' opened at line {}")
+    msg_unclosed = prefix + " Unclosed '{}' – missing matching closing bracket"
+    msg_semi = prefix + " Missing semicolon ';' at end of statement"
+
+    # ── 1. Fused pass: brackets + line grouping + brace depth ──────────
+    # One walk over the token list maintains the bracket stack and builds
+    # a flat non-error token list plus a line index: each line_starts entry
+    # records where a source line begins inside `flat` and the brace depth
+    # entering it. Consecutive entries delimit a line as a plain slice,
+    # replacing the old dict-of-lists (one hash probe plus a list
+    # allocation per line).
+    #
+    # The bracket stack is a preallocated buffer plus an integer cursor
+    # (doubled on overflow), so deeply nested code never pays list-grow
+    # reallocation inside the loop.
+    buf = [None] * 64   # each entry: (char, line, col)
+    top = 0
+
+    flat: list = []                 # non-ERROR tokens, in stream order
+    line_starts: list = []          # (line, index into flat, brace depth)
+    brace_depth = 0
+    last_line = None
+
+    # Bind everything the per-token loop touches to locals – the loop runs
+    # once per token and each LOAD_GLOBAL/LOAD_ATTR saved is paid back.
+    flat_append = flat.append
+    starts_append = line_starts.append
+    error_t = ERROR
+    delimiter_t = DELIMITER
+    brk_get = _BRK.get
 
-    # ── 2. Missing semicolons ──────────────────────────────────────────
-    # Group tokens by line, ignore preprocessor lines and blank lines.
-    lines_map: dict[int, list] = {}
     for tok in tokens:
-        if tok["type"] == "ERROR":
+        if tok.type is error_t:
             continue
-        ln = tok["line"]
-        lines_map.setdefault(ln, []).append(tok)
-
-    # Track brace depth so we only check inside function bodies.
-    # (Declarations at file scope also need `;` but outer-level `}`
-    #  closing a function is fine.)
-    # We use a simple pass: brace_depth ≥ 0 for everything.
-
-    # Build ordered line list
-    sorted_lines = sorted(lines_map.keys())
-
-    # We need to know brace depth per line — build a running total
-    brace_depth = 0
-    brace_by_line: dict[int, int] = {}   # depth ENTERING that line
-    for ln in sorted_lines:
-        brace_by_line[ln] = brace_depth
-        for tok in lines_map[ln]:
-            if tok["type"] == DELIMITER:
-                if tok["value"] == "{":
+        ln = tok.line
+        if ln != last_line:
+            last_line = ln
+            starts_append((ln, len(flat), brace_depth))
+        flat_append(tok)
+        if tok.type is delimiter_t:
+            v = tok.value
+            info = brk_get(v)
+            if info is None:
+                continue
+            kind, expected = info
+            if kind > 0:
+                if v == "{":
                     brace_depth += 1
-                elif tok["value"] == "}":
+                if top == len(buf):
+                    buf.extend([None] * top)
+                buf[top] = (v, ln, tok.column)
+                top += 1
+            else:
+                if v == "}":
                     brace_depth = max(0, brace_depth - 1)
+                if not top:
+                    yield _err(
+                        msg_unexpected.format(v, expected),
+                        v, ln, tok.column,
+                    )
+                elif buf[top - 1][0] != expected:
+                    op, ol, oc = buf[top - 1]
+                    yield _err(
+                        msg_mismatched.format(v, ln, op, ol),
+                        v, ln, tok.column,
+                    )
+                    top -= 1
+                else:
+                    top -= 1
 
-    for ln in sorted_lines:
-        toks = lines_map[ln]
-        if not toks:
-            continue
+    for (ch, line, col) in buf[:top]:
+        yield _err(msg_unclosed.format(ch), ch, line, col)
+
+    # ── 2. Missing semicolons ──────────────────────────────────────────
+    # line_starts is in token (= line) order; each line is a slice of flat.
+    n_flat = len(flat)
+    n_lines = len(line_starts)
+    for i, (ln, start, depth) in enumerate(line_starts):
+        end = line_starts[i + 1][1] if i + 1 < n_lines else n_flat
+        toks = flat[start:end]
 
         # Skip preprocessor lines
-        if toks[0]["type"] == PREPROCESSOR:
+        if toks[0].type is PREPROCESSOR:
             continue
 
-        # Find the last meaningful token on this line
+        # Classify the last meaningful token on this line
         last = toks[-1]
-
-        # Line ends with `;` or `{` or `}` or `,` → fine
-        if last["type"] == DELIMITER and last["value"] in (";", "{", "}", ",", ":"):
-            continue
-
-        # Line ends with a line-continuation operator or block-header keyword
-        if last["type"] == KEYWORD and last["value"] in _NO_SEMI_LAST_KW:
-            continue
-
-        # Line ends with an operator that bridges to next line (e.g.  +  &&  =)
-        if last["type"] == OPERATOR and last["value"] not in _STMT_END_OPS:
-            continue
-
-        # Line ends with `//` comment? (shouldn't happen – comments stripped)
-
-        # Now decide if this line SHOULD end with `;`
-        needs_semi = False
-
-        if last["type"] in _STMT_END_TYPES:
-            needs_semi = True
-        elif last["type"] == DELIMITER and last["value"] in _STMT_END_DELIMS:
+        cls = _LAST_CLASS.get((last.type, last.value))
+        if cls is None:
+            cls = _LAST_CLASS_BY_TYPE.get(last.type)
+            if cls is None:
+                continue
+
+        row = _NEEDS_SEMI[cls]
+        if row[0] != row[1]:
             # `)` could be end of function call or end of `if/for/while (…)`
-            # Find the first token on this line to check
+            # – the only row whose verdict depends on the line header.
             first_kw = None
             for t in toks:
-                if t["type"] == KEYWORD:
-                    first_kw = t["value"]
+                if t.type is KEYWORD:
+                    first_kw = t.value
                     break
-            if first_kw in _NO_SEMI_LAST_KW:
-                needs_semi = False
-            else:
-                needs_semi = True
-        elif last["type"] == OPERATOR and last["value"] in _STMT_END_OPS:
-            needs_semi = True
-        elif last["type"] == KEYWORD and last["value"] in _NEEDS_SEMI_KW:
-            needs_semi = True
-
-        if needs_semi and brace_by_line.get(ln, 0) > 0:
-            errors.append(_err(
-                f"{prefix} Missing semicolon ';' at end of statement",
-                last["value"], ln, last["column"] + len(str(last["value"])),
-            ))
+            hdr = first_kw in _NO_SEMI_LAST_KW
+        else:
+            hdr = False
 
-    return errors
+        if row[hdr] and depth > 0:
+            yield _err(msg_semi, last.value, ln, last.end_col)
 
 
 # ══════════════════════════════════════════════════════════════════════════
@@ -202,123 +306,94 @@ def check_c_syntax(tokens: list, lang: str = "C") -> list:
 
 # Keywords that introduce a compound statement and MUST be followed by `:`
 # at the END of that logical line.
-_PY_COMPOUND_KW = {
+_PY_COMPOUND_KW = frozenset({
     "if", "elif", "else", "for", "while",
     "def", "class", "with", "try", "except",
     "finally", "async",
-}
+})
 
 # `else`, `try`, `finally`, `except` do not always have an expression
 # but still need a colon.
 _PY_COLON_REQUIRED = _PY_COMPOUND_KW
 
+# Token types the logical-line pass never looks at. Stripping them once up
+# front removes the per-token layout branches and the per-line ERROR
+# re-filter the pass used to do.
+_PY_SKIP = frozenset({INDENT, DEDENT, NEWLINE, ERROR})
+
 
 def check_python_syntax(tokens: list) -> list:
     """
     Check token stream for Python structural errors.
     Returns list of error dicts.
     """
-    errors = []
+    return list(iter_python_errors(tokens))
+
+
+def iter_python_errors(tokens: list):
+    """
+    Yield Python structural errors as they are found. Callers that only
+    need "is this file valid?" can stop at the first error without
+    materializing the rest.
+    """
     prefix = "[Python Error]"
 
-    # ── 1. Bracket matching ────────────────────────────────────────────
-    stack = []
-    pairs = {")": "(", "]": "[", "}": "{"}
-    openers = set("([{")
-    closers = set(")]}")
+    # Message template, built once per call (see iter_c_errors).
+    msg_colon = prefix + " Missing colon ':' after '{}' statement header"
 
-    for tok in tokens:
-        if tok["type"] == "ERROR":
-            continue
-        if tok["type"] == DELIMITER:
-            v = tok["value"]
-            if v in openers:
-                stack.append((v, tok["line"], tok["column"]))
-            elif v in closers:
-                expected = pairs[v]
-                if not stack:
-                    errors.append(_err(
-                        f"{prefix} Unexpected '{v}' – no matching '{expected}'",
-                        v, tok["line"], tok["column"],
-                    ))
-                elif stack[-1][0] != expected:
-                    op, ol, oc = stack[-1]
-                    errors.append(_err(
-                        f"{prefix} Mismatched bracket: '{v}' at line {tok['line']} "
-                        f"does not close '{op}' opened at line {ol}",
-                        v, tok["line"], tok["column"],
-                    ))
-                    stack.pop()
-                else:
-                    stack.pop()
+    # ── 1. Bracket matching ────────────────────────────────────────────
+    yield from _iter_bracket_errors(tokens, prefix)
 
-    for (ch, line, col) in stack:
-        errors.append(_err(
-            f"{prefix} Unclosed '{ch}' – missing matching closing bracket",
-            ch, line, col,
-        ))
+    delimiter_t = DELIMITER
+    brk_get = _BRK.get
 
     # ── 2. Missing colon after compound-statement headers ──────────────
     # Strategy: group tokens by logical line using line numbers.
     # Inside brackets (paren_depth > 0), lines are joined.
-
-    logical_lines: list[list] = []
-    current: list = []
+    #
+    # Layout and error tokens are stripped once up front, then the check
+    # streams: a logical line is judged the moment it ends, and only its
+    # first and last token are ever held. Lines that do not open with a
+    # compound-statement keyword are dropped as soon as their first token
+    # is seen, so nothing is accumulated for them.
+
+    sig = [t for t in tokens if t.type not in _PY_SKIP]
+
+    keyword_t = KEYWORD
+    first = last = None
+    interesting = False     # line starts with a compound-statement keyword
     p_depth = 0
     last_line = None
 
-    for tok in tokens:
-        if tok["type"] in ("INDENT", "DEDENT"):
-            continue
-        if tok["type"] == "ERROR":
-            current.append(tok)
-            continue
-        
-        # Detect logical line breaks BEFORE appending the token
-        if last_line is not None and tok["line"] != last_line and p_depth == 0:
-            if current:
-                logical_lines.append(current)
-                current = []
-        
-        # Now append the token to current line
-        current.append(tok)
-        
-        # Track bracket depth
-        if tok["type"] == DELIMITER and tok["value"] in "([{":
-            p_depth += 1
-        elif tok["type"] == DELIMITER and tok["value"] in ")]}":
-            p_depth = max(0, p_depth - 1)
-        
-        last_line = tok["line"]
-
-    if current:
-        logical_lines.append(current)
-
-    for line_toks in logical_lines:
-        # Filter out ERROR tokens for analysis
-        real = [t for t in line_toks if t["type"] != "ERROR"]
-        if not real:
-            continue
-
-        first = real[0]
-        last  = real[-1]
-
-        # Does this logical line start with a compound-statement keyword?
-        if first["type"] != KEYWORD or first["value"] not in _PY_COLON_REQUIRED:
-            continue
-
-        # The line should end with `:` (a DELIMITER)
-        if last["type"] == DELIMITER and last["value"] == ":":
-            continue
-
-        # If the last token is already an error, skip (already reported)
-        if last["type"] == "ERROR":
-            continue
-
-        kw = first["value"]
-        errors.append(_err(
-            f"{prefix} Missing colon ':' after '{kw}' statement header",
-            kw, first["line"], last["column"] + len(str(last["value"])),
-        ))
-
-    return errors
+    for tok in sig:
+        # Detect logical line breaks BEFORE taking the token
+        if last_line is not None and tok.line != last_line and p_depth == 0:
+            if interesting and not (
+                last.type is delimiter_t and last.value == ":"
+            ):
+                kw = first.value
+                yield _err(
+                    msg_colon.format(kw), kw, first.line, last.end_col,
+                )
+            first = None
+
+        if first is None:
+            first = tok
+            interesting = (tok.type is keyword_t
+                           and tok.value in _PY_COLON_REQUIRED)
+        last = tok
+
+        # Track bracket depth (same module-level table as the matcher)
+        if tok.type is delimiter_t:
+            info = brk_get(tok.value)
+            if info is not None:
+                if info[0] > 0:
+                    p_depth += 1
+                elif p_depth:
+                    p_depth -= 1
+
+        last_line = tok.line
+
+    if interesting and not (last.type is delimiter_t and last.value == ":"):
+        kw = first.value
+        yield _err(msg_colon.format(kw), kw, first.line, last.end_col)
@@ -1,47 +1,83 @@
 """
 Token type definitions shared across all lexers.
-Each token is represented as a dict:
-  {
-    "type"    : str   – token category,
-    "value"   : str   – raw lexeme,
-    "line"    : int   – 1-based line number,
-    "column"  : int   – 1-based column number,
-  }
-
-Error entries carry an additional "message" key.
+Each token is a slotted Token object with attributes:
+    type    : str  – token category
+    value   : str  – raw lexeme
+    line    : int  – 1-based line number
+    column  : int  – 1-based column number
+    end_col : int  – column just past the lexeme (internal, not serialized)
+    message : str | None  – set on error tokens only
+
+as_dict() produces the dict shape the JSON API has always returned.
 """
 
+from sys import intern
+
 # ── Generic ────────────────────────────────────────────────────────────────
-KEYWORD        = "KEYWORD"
-IDENTIFIER     = "IDENTIFIER"
-INTEGER        = "INTEGER"
-FLOAT          = "FLOAT"
-STRING         = "STRING"
-CHAR           = "CHAR"
-OPERATOR       = "OPERATOR"
-DELIMITER      = "DELIMITER"
-COMMENT        = "COMMENT"          # kept internally; stripped before output
-PREPROCESSOR   = "PREPROCESSOR"     # C / C++ only  (#include, #define …)
-BOOLEAN        = "BOOLEAN"          # Python True/False, C++ true/false
-NONE_TOKEN     = "NONE"             # Python None
-NEWLINE        = "NEWLINE"          # Python significant newline
-INDENT         = "INDENT"           # Python indentation increase
-DEDENT         = "DEDENT"           # Python indentation decrease
-F_STRING        = "F_STRING"         # Python f-string
+# Interned explicitly so consumers may compare token types with `is`
+# (single pointer test) instead of string equality.
+KEYWORD        = intern("KEYWORD")
+IDENTIFIER     = intern("IDENTIFIER")
+INTEGER        = intern("INTEGER")
+FLOAT          = intern("FLOAT")
+STRING         = intern("STRING")
+CHAR           = intern("CHAR")
+OPERATOR       = intern("OPERATOR")
+DELIMITER      = intern("DELIMITER")
+COMMENT        = intern("COMMENT")          # kept internally; stripped before output
+PREPROCESSOR   = intern("PREPROCESSOR")     # C / C++ only  (#include, #define …)
+BOOLEAN        = intern("BOOLEAN")          # Python True/False, C++ true/false
+NONE_TOKEN     = intern("NONE")             # Python None
+NEWLINE        = intern("NEWLINE")          # Python significant newline
+INDENT         = intern("INDENT")           # Python indentation increase
+DEDENT         = intern("DEDENT")           # Python indentation decrease
+F_STRING       = intern("F_STRING")         # Python f-string
 
 # ── Error ──────────────────────────────────────────────────────────────────
-ERROR          = "ERROR"
+ERROR          = intern("ERROR")
+
+
+class Token:
+    """
+    Slotted token record: attribute access is a single slot load instead
+    of a dict hash probe, and each token is roughly a third the size of
+    the dict shape it replaced.
+    """
+
+    __slots__ = ("type", "value", "line", "column", "end_col", "message")
+
+    def __init__(self, ttype: str, value: str, line: int, column: int,
+                 message: str = None):
+        self.type    = ttype
+        self.value   = value
+        self.line    = line
+        self.column  = column
+        # Internal span end (column just past the lexeme); derivable from
+        # column + len(value), precomputed once so consumers such as the
+        # syntax checker need a single attribute load. Not part of the
+        # JSON shape, so as_dict() omits it.
+        self.end_col = column + len(value)
+        self.message = message
+
+    def as_dict(self) -> dict:
+        """Materialize the dict shape used by the JSON API."""
+        d = {
+            "type":   self.type,
+            "value":  self.value,
+            "line":   self.line,
+            "column": self.column,
+        }
+        if self.message is not None:
+            d["message"] = self.message
+        return d
+
+    def __repr__(self):
+        return f"Token({self.type!r}, {self.value!r}, {self.line}, {self.column})"
 
 
-def make_token(ttype: str, value: str, line: int, col: int) -> dict:
-    return {"type": ttype, "value": value, "line": line, "column": col}
+def make_token(ttype: str, value: str, line: int, col: int) -> Token:
+    return Token(ttype, value, line, col)
 
 
-def make_error(message: str, value: str, line: int, col: int) -> dict:
-    return {
-        "type": ERROR,
-        "value": value,
-        "line": line,
-        "column": col,
-        "message": message,
-    }
+def make_error(message: str, value: str, line: int, col: int) -> Token:
+    return Token(ERROR, value, line, col, message)